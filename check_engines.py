@@ -0,0 +1,167 @@
+"""
+Differential check: fast engine vs frozen reference engine.
+
+Runs both engines over a generated corpus plus fuzzed edge cases, seeding the
+random module identically before each run, and checks that the humanized text,
+aiScore and readabilityScore are identical. Also reports the speedup.
+
+Usage:
+    python check_engines.py [--cases 300] [--seed 1234] [--repeat 3]
+
+Exits with status 1 if any case differs.
+"""
+import argparse
+import random
+import sys
+import time
+
+import fast_engine
+import reference_engine
+
+# Words and phrases that trigger every stage of the humanizer and the detector
+TRIGGER_PHRASES = [
+    'in order to', 'due to the fact that', 'at this point in time',
+    'it is important to note that', 'in spite of', 'a large number of',
+    'for the purpose of', 'with regard to', 'prior to', 'subsequent to',
+    'however', 'therefore', 'furthermore', 'nevertheless', 'Overall,',
+    'In conclusion,', 'the article demonstrates', 'this shows that',
+    'one can see', 'in the modern world', 'do not', 'does not', 'is not',
+    'are not', 'it is', 'that is', 'you are', 'they are', 'we are',
+    'will not', 'would not', 'cannot', 'could not', 'should not', 'Q:', 'A:',
+    ' - ', 'the article'
+]
+VOCABULARY = [
+    'important', 'need', 'are', 'give', 'have', 'keep', 'make', 'form', 'live',
+    'talk', 'big', 'gentle', 'useful', 'well-known', 'calm', 'very', 'really',
+    'only', 'actually', 'demonstrates', 'demonstrate', 'represents', 'represent',
+    'major', 'advancement', 'transitions', 'traditional', 'intelligent',
+    'capable', 'vast', 'complex', 'because', 'but', 'also', 'and', 'for', 'or',
+    'while', 'the', 'with', 'from', 'this', 'that', 'will', 'can', 'should',
+    'would', 'been', 'them', 'than', 'then', 'good', 'difficult', 'easy',
+    'clear', 'effective', 'simple', 'cows', 'animals', 'grass', 'system',
+    'data', 'model', 'people', 'research', 'world', 'a', 'an', 'of', 'to', 'in',
+    'is', 'it', 'they', 'we', 'you', 'teh', 'recieve', "don't", "it's"
+]
+PUNCTUATION = ['.', '.', '.', '!', '?', '...', ';', ':', '—', '.  ', '.\n\n']
+
+EDGE_CASES = [
+    '', ' ', '\n', '.', '...', '....', '!!!', '???', '. . .', 'Q:', 'A:',
+    'Q: A:', 'q:a:', 'a', 'A', 'and', 'And.', 'The', 'the the the',
+    'Overall,', 'overall, ', 'however', 'However, however, however.',
+    '  leading and trailing  ', 'tabs\tand\tnewlines\n\nhere.',
+    'Mr. Smith went to Washington. He did not return.',
+    'ÉCOLE naïve café — résumé. Ünïcödé!', '数字 123 456. Ok?',
+    'well-known well-known WELL-KNOWN Well-Known.',
+    'It is. It is. It is. It is. It is.',
+    'a' * 500, ('word ' * 101).strip(), ('word. ' * 310).strip(),
+    ' - - - ', 'end with space before period .', 'double..period',
+    'CANNOT Cannot cannot', 'Do Not do not DO NOT',
+    # Non-ASCII letters that IGNORECASE folds onto ASCII ones
+    'Thiſ ſhows that İt iſ \u212aEEP, ıt ıs very ımportant.',
+]
+
+
+def build_sentence(rng):
+    words = []
+    for _ in range(rng.randint(1, 40)):
+        if rng.random() < 0.15:
+            words.append(rng.choice(TRIGGER_PHRASES))
+        else:
+            word = rng.choice(VOCABULARY)
+            words.append(word.capitalize() if rng.random() < 0.1 else word)
+    if words:
+        words[0] = words[0][0].upper() + words[0][1:] if words[0] else words[0]
+    return ' '.join(words) + rng.choice(PUNCTUATION)
+
+
+def build_text(rng):
+    """Random text, weighted so short, long and very long tiers all get hit"""
+    target_words = rng.choice([rng.randint(1, 100), rng.randint(101, 300), rng.randint(301, 700)])
+    sentences = []
+    word_count = 0
+    while word_count < target_words:
+        sentence = build_sentence(rng)
+        sentences.append(sentence)
+        word_count += len(sentence.split())
+    return ' '.join(sentences)
+
+
+def fuzz_text(rng):
+    """Random character soup around the characters the regexes care about"""
+    alphabet = 'abcdeQAT .,!?;:—-\n\t\'' + 'aeiou' * 3 + 'ſıİ\u212aé'
+    return ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 400)))
+
+
+def build_corpus(cases, seed):
+    rng = random.Random(seed)
+    corpus = list(EDGE_CASES)
+    for i in range(cases):
+        corpus.append(fuzz_text(rng) if i % 5 == 4 else build_text(rng))
+    return corpus
+
+
+def run_engine(engine, text, seed):
+    """Humanize and score one text, returning the values the API responds with"""
+    random.seed(seed)
+    try:
+        humanized = engine.humanize_text_aggressive(text)
+    except Exception as e:
+        return ('error', type(e).__name__, str(e))
+    return (
+        humanized,
+        engine.calculate_ai_score(humanized),
+        engine.flesch_reading_ease(humanized),
+        # Score the raw input too so the detector is checked on unhumanized text
+        engine.calculate_ai_score(text),
+        engine.flesch_reading_ease(text)
+    )
+
+
+def time_engine(engine, corpus, seed, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i, text in enumerate(corpus):
+            run_engine(engine, text, seed + i)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--cases', type=int, default=300, help='number of generated texts')
+    parser.add_argument('--seed', type=int, default=1234, help='seed for the corpus and engine RNG')
+    parser.add_argument('--repeat', type=int, default=3, help='timing runs per engine (best is kept)')
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.cases, args.seed)
+
+    mismatches = []
+    for i, text in enumerate(corpus):
+        expected = run_engine(reference_engine, text, args.seed + i)
+        actual = run_engine(fast_engine, text, args.seed + i)
+        if expected != actual:
+            mismatches.append((i, text, expected, actual))
+
+    print(f'Checked {len(corpus)} texts ({len(EDGE_CASES)} edge cases, {args.cases} generated)')
+    for i, text, expected, actual in mismatches[:5]:
+        print(f'\n❌ Case {i} (seed {args.seed + i}): {text[:80]!r}')
+        print(f'   reference: {expected!r}'[:300])
+        print(f'   fast:      {actual!r}'[:300])
+
+    reference_time = time_engine(reference_engine, corpus, args.seed, args.repeat)
+    fast_time = time_engine(fast_engine, corpus, args.seed, args.repeat)
+    print(f'\nreference: {reference_time * 1000:.1f} ms')
+    print(f'fast:      {fast_time * 1000:.1f} ms')
+    print(f'speedup:   {reference_time / fast_time:.2f}x')
+
+    if mismatches:
+        print(f'\n❌ {len(mismatches)} of {len(corpus)} texts differ')
+        return 1
+    print('\n✅ All texts, aiScore and readabilityScore values identical')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
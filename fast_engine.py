@@ -0,0 +1,677 @@
+"""
+Fast humanization engine.
+
+Produces exactly the same output as reference_engine.py for the same random
+seed, but hoists the word tables and regexes out of the per-request path,
+searches for whole words on lowercased text instead of with IGNORECASE, and
+avoids rebuilding the whole text for every single replacement.
+Run check_engines.py after any change here.
+"""
+import re
+import random
+import math
+from functools import lru_cache
+
+# === Scoring patterns ===
+NON_ALPHA_LOWER = re.compile(r'[^a-z]')
+VOWEL_GROUPS = re.compile(r'[aeiouy]+')
+SENTENCE_SPLIT = re.compile(r'[.!?]+')
+FIRST_WORD = re.compile(r'^\s*(\w+)')
+
+CONTRACTION_WORDS = re.compile(
+    r"\b(don't|doesn't|didn't|can't|won't|wouldn't|shouldn't|isn't|aren't|wasn't|weren't|haven't|hasn't|hadn't|it's|that's|there's|what's|who's|you're|they're|we're|couldn't|I'm|we've|I'll|you'll|he's|she's|they've|we'd|you'd)\b",
+    re.IGNORECASE
+)
+
+FOLDS_TO_ASCII = re.compile('[\u0130\u0131\u017f\u212a]')
+
+def _word_pattern(source):
+    """
+    Compile a pattern that starts with \\b two ways: case-insensitive for any text,
+    and case-sensitive minus the leading \\b for lowercased text. The second
+    form starts with a literal, which re can search for much faster.
+    """
+    return re.compile(source, re.IGNORECASE), re.compile(source[2:])
+
+CRITICAL_AI_PHRASES = [_word_pattern(pattern) for pattern in [
+    r'\boverall,?\s', r'\bin conclusion,?\s', r'\bto sum up,?\s', r'\bin summary,?\s',
+    r'\bthe article demonstrates\b', r'\bthe text shows\b', r'\bthe passage illustrates\b',
+    r'\bthis demonstrates that\b', r'\bthis shows that\b', r'\bthis illustrates\b',
+    r'\bit is important to note that\b', r'\bit should be noted that\b',
+    r'\bone can (see|observe|conclude)\b', r'\bas can be seen\b',
+    r'\bin order to\b', r'\bdue to the fact that\b', r'\bfor the purpose of\b',
+    r'\bat this point in time\b', r'\bin the modern world\b', r'\bin today\'?s society\b'
+]]
+
+FORMAL_TRANSITIONS = re.compile(
+    r'\b(however|therefore|furthermore|moreover|consequently|additionally|nevertheless|thus|hence|accordingly|subsequently)\b',
+    re.IGNORECASE
+)
+TYPO_WORDS = re.compile(
+    r'\b(teh|taht|tehm|waht|whcih|jsut|tehn|thier|recieve|occured|writting|goverment|seperate|definately)\b',
+    re.IGNORECASE
+)
+DOUBLE_SPACES = re.compile(r'  +')
+MISSING_COMMAS = re.compile(
+    r'\b(however|therefore|furthermore|moreover|consequently)\s+[a-z]',
+    re.IGNORECASE
+)
+PERIOD_NOSPACE = re.compile(r'\.[A-Z]')
+CASUAL_MARKERS = re.compile(
+    r'\b(really|pretty|quite|actually|basically|honestly|literally|totally|kinda|sorta|gonna|wanna|yeah|nope|ok|okay)\b',
+    re.IGNORECASE
+)
+NON_PERIOD_PUNCT = re.compile(r'[!?;:—]')
+
+# === Humanization tables ===
+PHRASE_REPLACEMENTS = {
+    'in order to': ['to', 'so we can', 'aiming to'],
+    'due to the fact that': ['because', 'since'],
+    'at this point in time': ['now', 'currently'],
+    'it is important to note that': ['notably', 'it\'s worth noting'],
+    'in spite of': ['despite', 'even though'],
+    'a large number of': ['many', 'lots of', 'tons of'],
+    'for the purpose of': ['to', 'for'],
+    'with regard to': ['about', 'regarding'],
+    'prior to': ['before'],
+    'subsequent to': ['after'],
+    'however': ['but', 'yet', 'though', 'still'],
+    'therefore': ['so', 'thus', 'hence'],
+    'furthermore': ['also', 'plus', 'moreover'],
+    'nevertheless': ['still', 'even so', 'yet']
+}
+
+SYNONYMS = {
+    # Common verbs
+    'important': ['crucial', 'key', 'vital'],
+    'need': ['require', 'want'],
+    'are': ['become'],
+    'give': ['provide', 'offer'],
+    'have': ['possess', 'own', 'keep'],
+    'keep': ['maintain', 'hold'],
+    'make': ['create', 'form', 'build'],
+    'form': ['create', 'make', 'build'],
+    'live': ['exist', 'survive'],
+    'talk': ['speak', 'communicate'],
+
+    # Descriptive words
+    'big': ['large', 'huge'],
+    'gentle': ['calm', 'peaceful'],
+    'useful': ['helpful', 'valuable'],
+    'well-known': ['famous', 'popular'],
+    'calm': ['peaceful', 'relaxed'],
+
+    # Adverbs & intensifiers
+    'very': ['really', 'quite', 'pretty', 'extremely'],
+    'really': ['very', 'truly', 'actually'],
+    'only': ['just', 'simply'],
+    'actually': ['really', 'truly'],
+
+    # Complex words
+    'demonstrates': ['shows', 'proves', 'reveals'],
+    'demonstrate': ['show', 'prove', 'reveal'],
+    'represents': ['is', 'means', 'shows'],
+    'represent': ['show', 'mean'],
+    'major': ['big', 'huge', 'significant'],
+    'advancement': ['progress', 'improvement'],
+    'transitions': ['shifts', 'moves', 'changes'],
+    'traditional': ['old', 'conventional', 'standard'],
+    'intelligent': ['smart', 'clever'],
+    'capable': ['able', 'equipped'],
+    'vast': ['huge', 'massive'],
+    'complex': ['complicated', 'intricate'],
+
+    # Connectors
+    'because': ['since', 'as'],
+    'but': ['yet', 'though', 'although'],
+    'also': ['too', 'as well'],
+    'and': ['plus'],
+    'for': ['during']
+}
+
+CONTRACTIONS = {
+    'do not': 'don\'t', 'does not': 'doesn\'t', 'is not': 'isn\'t',
+    'are not': 'aren\'t', 'it is': 'it\'s', 'that is': 'that\'s',
+    'you are': 'you\'re', 'they are': 'they\'re', 'we are': 'we\'re',
+    'will not': 'won\'t', 'would not': 'wouldn\'t', 'cannot': 'can\'t',
+    'could not': 'couldn\'t', 'should not': 'shouldn\'t'
+}
+
+# Order matters: every table is applied in dict order, same as the reference
+PHRASE_PATTERNS = [
+    (_word_pattern(r'\b' + re.escape(phrase) + r'\b'), alternatives)
+    for phrase, alternatives in PHRASE_REPLACEMENTS.items()
+]
+SYNONYM_PATTERNS = [
+    (_word_pattern(r'\b' + word + r'\b'), alternatives)
+    for word, alternatives in SYNONYMS.items()
+]
+CONTRACTION_PATTERNS = [
+    (_word_pattern(r'\b' + re.escape(phrase) + r'\b'), contraction)
+    for phrase, contraction in CONTRACTIONS.items()
+]
+
+QA_QUESTION = re.compile(r'\bQ:\s*', re.IGNORECASE)
+QA_ANSWER = re.compile(r'\bA:\s*', re.IGNORECASE)
+QUESTION_VARIATIONS = ['Q:', 'Question:', 'Q -', 'Q.', '**Q:**']
+ANSWER_VARIATIONS = ['A:', 'Answer:', 'A -', 'A.', '**A:**', '']
+
+SENTENCE_PARTS = re.compile(r'([.!?]+)')
+INTENSIFIABLE = re.compile(r'\b(good|important|difficult|easy|clear|effective|simple)\b')
+SPLIT_CONJUNCTIONS = ('and', 'but', 'or', 'while', 'because')
+
+SAFE_TYPO_WORDS = frozenset(['the', 'and', 'but', 'for', 'with', 'from', 'this', 'that', 'have', 'will', 'can', 'should', 'would', 'been', 'them', 'than', 'then'])
+NON_ALPHA = re.compile(r'[^a-zA-Z]')
+FIRST_LETTERS = re.compile(r'[a-zA-Z]+')
+
+PERIOD_BEFORE_CAPITAL = re.compile(r'\.\s+([A-Z])')
+COMMA_SPACE = re.compile(r',\s+')
+PERIOD_BEFORE_LOWER = re.compile(r'\.\s+([a-z])')
+OVERALL_STARTER = re.compile(r'\bOverall,\s*', re.IGNORECASE)
+OVERALL_ALTERNATIVES = ['So basically,', 'In the end,', 'To sum up,', 'Ultimately,', 'Looking at it,', '']
+THE_ARTICLE = re.compile(r'\bthe article\b', re.IGNORECASE)
+ARTICLE_ALTERNATIVES = ['the article', 'this article', 'the piece', 'this paper', 'it']
+PARAGRAPH_TRANSITIONS = ['Now', 'Additionally', 'Moreover', 'On the other hand',
+                         'However', 'In fact', 'Furthermore', 'That said', 'Plus', 'Also']
+PERIOD_SPACE = re.compile(r'\. ')
+SPACED_HYPHEN = re.compile(r' - ')
+
+EXCESS_WHITESPACE = re.compile(r'\s{3,}')
+EXCESS_PERIODS = re.compile(r'\.{4,}')
+SPACE_BEFORE_PERIOD = re.compile(r'\s+\.')
+EXCESS_NEWLINES = re.compile(r'\n{3,}')
+DOUBLE_PERIOD = re.compile(r'\.\.')
+
+
+def _lowered_for_search(text):
+    """
+    Lowercased text for the fast word search, or None if it can't be used.
+
+    IGNORECASE also folds a few non-ASCII letters onto ASCII ones ('İ', 'ı', 'ſ'
+    and the Kelvin sign), so text containing them goes through the regular
+    patterns. Every other character lowercases to a single non-ASCII character
+    of the same class, so match positions and word boundaries line up.
+    """
+    if FOLDS_TO_ASCII.search(text):
+        return None
+    return text.lower()
+
+def _word_spans(text, lowered, word_pattern):
+    """
+    (start, end) of every match of a _word_pattern, same as pattern.finditer(text).
+
+    None of the table entries can overlap another occurrence of itself at a word
+    start, so checking the leading word boundary after the search is equivalent.
+    """
+    pattern, tail = word_pattern
+    if lowered is None:
+        return [m.span() for m in pattern.finditer(text)]
+    return [
+        m.span() for m in tail.finditer(lowered)
+        if m.start() == 0 or not (lowered[m.start() - 1].isalnum() or lowered[m.start() - 1] == '_')
+    ]
+
+def _splice(text, replacements):
+    """Apply sorted, non-overlapping (start, end, replacement) edits in one pass"""
+    if not replacements:
+        return text
+    pieces = []
+    last = 0
+    for start, end, replacement in replacements:
+        pieces.append(text[last:start])
+        pieces.append(replacement)
+        last = end
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+@lru_cache(maxsize=4096)
+def count_syllables(word):
+    """Estimate syllable count for readability score"""
+    word = word.lower()
+    word = NON_ALPHA_LOWER.sub('', word)
+    if not word:
+        return 0
+    vowel_groups = VOWEL_GROUPS.findall(word)
+    return max(1, len(vowel_groups))
+
+def flesch_reading_ease(text):
+    """Calculate Flesch Reading Ease score"""
+    words = text.strip().split()
+    word_count = len(words) if words else 1
+    sentences = [s.strip() for s in SENTENCE_SPLIT.split(text) if s.strip()]
+    sentence_count = max(1, len(sentences))
+    syllable_count = sum(count_syllables(w) for w in words)
+    syllable_count = max(1, syllable_count)
+
+    score = 206.835 - (1.015 * (word_count / sentence_count)) - (84.6 * (syllable_count / word_count))
+    return round(score, 1)
+
+def calculate_ai_score(text):
+    """
+    HIGHLY ACCURATE AI detection score (0-10 scale, representing 0-100%).
+    Same factors and weights as the reference engine, see reference_engine.py
+    for the commentary on each one.
+    """
+    ai_confidence = 0  # Will range from -100 (very human) to +100 (very AI)
+
+    words = text.strip().split()
+    word_count = len(words) if words else 1
+    sentences = [s.strip() for s in SENTENCE_SPLIT.split(text) if s.strip()]
+    sentence_count = max(1, len(sentences))
+
+    # === CRITICAL FACTOR 1: Perplexity (Sentence Length Consistency) ===
+    sentence_lengths = [len(s.split()) for s in sentences]
+    if len(sentence_lengths) > 2:
+        avg_len = sum(sentence_lengths) / len(sentence_lengths)
+        variance = sum((l - avg_len) ** 2 for l in sentence_lengths) / len(sentence_lengths)
+        std_dev = math.sqrt(variance)
+        coefficient_of_variation = (std_dev / avg_len) if avg_len > 0 else 0
+
+        if coefficient_of_variation < 0.15:
+            ai_confidence += 35
+        elif coefficient_of_variation < 0.25:
+            ai_confidence += 25
+        elif coefficient_of_variation < 0.35:
+            ai_confidence += 15
+        elif coefficient_of_variation < 0.45:
+            ai_confidence += 5
+        elif coefficient_of_variation > 0.7:
+            ai_confidence -= 25
+        elif coefficient_of_variation > 0.55:
+            ai_confidence -= 15
+
+    # === CRITICAL FACTOR 2: Burstiness (Paragraph Flow) ===
+    if len(sentence_lengths) > 3:
+        consecutive_similar = sum(
+            1 for a, b in zip(sentence_lengths, sentence_lengths[1:]) if abs(a - b) < 3
+        )
+        similarity_ratio = consecutive_similar / (len(sentence_lengths) - 1)
+        if similarity_ratio > 0.7:
+            ai_confidence += 20
+        elif similarity_ratio < 0.3:
+            ai_confidence -= 15
+
+    # === CRITICAL FACTOR 3: Contractions ===
+    contractions = len(CONTRACTION_WORDS.findall(text))
+    contraction_density = contractions / word_count
+
+    if contraction_density == 0 and word_count > 30:
+        ai_confidence += 30
+    elif contraction_density < 0.01:
+        ai_confidence += 20
+    elif contraction_density < 0.02:
+        ai_confidence += 10
+    elif contraction_density > 0.05:
+        ai_confidence -= 20
+    elif contraction_density > 0.03:
+        ai_confidence -= 10
+
+    # === CRITICAL FACTOR 4: AI Red Flag Phrases ===
+    lowered = _lowered_for_search(text)
+    red_flag_count = 0
+    for word_pattern in CRITICAL_AI_PHRASES:
+        red_flag_count += len(_word_spans(text, lowered, word_pattern))
+
+    ai_confidence += red_flag_count * 15
+
+    # === CRITICAL FACTOR 5: Repetitive Sentence Starters ===
+    first_words = []
+    for s in sentences:
+        match = FIRST_WORD.match(s)
+        if match:
+            first_words.append(match.group(1).lower())
+
+    if len(first_words) > 3:
+        unique_starters = len(set(first_words))
+        starter_variety = unique_starters / len(first_words)
+
+        if starter_variety < 0.4:
+            ai_confidence += 25
+        elif starter_variety < 0.6:
+            ai_confidence += 12
+        elif starter_variety > 0.85:
+            ai_confidence -= 15
+
+    # === FACTOR 6: Transition Word Overuse ===
+    formal_transitions = len(FORMAL_TRANSITIONS.findall(text))
+    transition_density = formal_transitions / sentence_count
+
+    if transition_density > 0.4:
+        ai_confidence += 25
+    elif transition_density > 0.25:
+        ai_confidence += 15
+    elif transition_density > 0.15:
+        ai_confidence += 8
+
+    # === FACTOR 7: Human Imperfections (STRONG human signal) ===
+    imperfection_score = 0
+    imperfection_score += len(TYPO_WORDS.findall(text)) * 8
+    imperfection_score += len(DOUBLE_SPACES.findall(text)) * 5
+    imperfection_score += len(MISSING_COMMAS.findall(text)) * 6
+    imperfection_score += len(PERIOD_NOSPACE.findall(text)) * 7
+
+    ai_confidence -= imperfection_score
+
+    # === FACTOR 8: Casual/Conversational Language ===
+    casual_markers = len(CASUAL_MARKERS.findall(text))
+    casual_density = casual_markers / word_count
+
+    if casual_density > 0.04:
+        ai_confidence -= 20
+    elif casual_density > 0.02:
+        ai_confidence -= 12
+    elif casual_density == 0 and word_count > 50:
+        ai_confidence += 10
+
+    # === FACTOR 9: Punctuation Variety ===
+    exclamation_count = text.count('!')
+    punct_score = 0
+
+    if '...' in text: punct_score += 8
+    if '—' in text: punct_score += 8
+    if ';' in text: punct_score += 6
+    if exclamation_count in [1, 2, 3]: punct_score += 7
+    if '?' in text: punct_score += 5
+    if ':' in text: punct_score += 4
+
+    only_periods = not NON_PERIOD_PUNCT.search(text)
+    if only_periods and sentence_count > 3:
+        ai_confidence += 15
+    else:
+        ai_confidence -= punct_score
+
+    # === FACTOR 10: Word Repetition ===
+    word_list = [NON_ALPHA_LOWER.sub('', w.lower()) for w in words]
+    word_list = [w for w in word_list if len(w) > 3]
+
+    if len(word_list) > 10:
+        unique_words = set(word_list)
+        repetition_ratio = len(unique_words) / len(word_list)
+
+        if repetition_ratio < 0.5:
+            ai_confidence += 18
+        elif repetition_ratio < 0.65:
+            ai_confidence += 10
+        elif repetition_ratio > 0.85:
+            ai_confidence -= 12
+
+    # === FACTOR 11: Exclamation Overuse or Absence ===
+    if exclamation_count == 0 and word_count > 50:
+        ai_confidence += 8
+    elif exclamation_count > 5 and sentence_count < 10:
+        ai_confidence += 12
+    elif 1 <= exclamation_count <= 3:
+        ai_confidence -= 8
+
+    # === FINAL CALCULATION ===
+    ai_percentage = 50 + (ai_confidence / 2)
+    ai_percentage = max(0, min(100, ai_percentage))
+
+    display_score = round(ai_percentage / 10)
+
+    return display_score
+
+def _replace_matches(text, lowered, word_pattern, threshold, choose):
+    """
+    Replace a random subset of pattern matches in a single pass.
+
+    Matches are visited last-to-first so random numbers are drawn in the same
+    order as the reference engine's in-place loop.
+    """
+    replacements = []
+    for start, end in reversed(_word_spans(text, lowered, word_pattern)):
+        if random.random() > threshold:
+            replacements.append((start, end, choose(text[start:end])))
+    replacements.reverse()
+    return _splice(text, replacements)
+
+def humanize_text_aggressive(text):
+    """
+    Smart humanization: More aggressive for long texts, balanced for short texts.
+    Guarantees AI detection score under 10.
+    """
+
+    # Detect text length and adjust aggressiveness
+    word_count = len(text.split())
+    is_long_text = word_count > 100  # Long paragraph threshold
+    is_very_long = word_count > 300  # Very long text
+
+    # Adjust rates based on length - Natural humanization like QuillBot
+    if is_very_long:
+        synonym_rate = 0.65  # 65% for very long
+        contraction_rate = 0.80  # 80%
+        casual_rate = 0.45  # 45%
+        filler_rate = 0.35  # 35%
+        starter_rate = 0.30  # 30%
+    elif is_long_text:
+        synonym_rate = 0.60  # 60% for long
+        contraction_rate = 0.75  # 75%
+        casual_rate = 0.40  # 40%
+        filler_rate = 0.30  # 30%
+        starter_rate = 0.25  # 25%
+    else:
+        synonym_rate = 0.50  # 50% for short
+        contraction_rate = 0.70  # 70%
+        casual_rate = 0.35  # 35%
+        filler_rate = 0.25  # 25%
+        starter_rate = 0.20  # 20%
+
+    # 1. Replace formal phrases
+    lowered = _lowered_for_search(text)
+    for word_pattern, alternatives in PHRASE_PATTERNS:
+        spans = _word_spans(text, lowered, word_pattern)
+        if spans:
+            text = _splice(text, [(start, end, random.choice(alternatives)) for start, end in spans])
+            lowered = _lowered_for_search(text)
+
+    # 2. Natural synonym replacement - Like QuillBot
+    def choose_synonym(original):
+        replacement = random.choice(alternatives)
+        # Preserve original capitalization
+        if original[0].isupper():
+            replacement = replacement[0].upper() + replacement[1:] if len(replacement) > 1 else replacement.upper()
+        return replacement
+
+    synonym_threshold = 1 - synonym_rate
+    for word_pattern, alternatives in SYNONYM_PATTERNS:
+        replaced = _replace_matches(text, lowered, word_pattern, synonym_threshold, choose_synonym)
+        if replaced is not text:
+            text = replaced
+            lowered = _lowered_for_search(text)
+
+    # 3. Add contractions
+    contraction_threshold = 1 - contraction_rate
+    for word_pattern, contraction in CONTRACTION_PATTERNS:
+        replaced = _replace_matches(text, lowered, word_pattern, contraction_threshold, lambda original: contraction)
+        if replaced is not text:
+            text = replaced
+            lowered = _lowered_for_search(text)
+
+    # 4. Break Q: and A: patterns
+    text = QA_QUESTION.sub(lambda m: random.choice(QUESTION_VARIATIONS) + ' ', text)
+    text = QA_ANSWER.sub(lambda m: random.choice(ANSWER_VARIATIONS) + ' ', text)
+
+    # 5. Add casual language (dynamic based on text length)
+    fillers = ['basically', 'actually', 'honestly'] if is_long_text else ['basically', 'actually']
+    casual = ['pretty', 'really', 'quite', 'fairly'] if is_long_text else ['pretty', 'really', 'quite']
+    starters = ['And ', 'But ', 'So ', 'Plus '] if is_long_text else ['And ', 'But ', 'So ']
+    filler_threshold = 1 - filler_rate
+    casual_threshold = 1 - casual_rate
+    starter_threshold = 1 - starter_rate
+
+    sentences = SENTENCE_PARTS.split(text)
+    result = []
+
+    for i, part in enumerate(sentences):
+        if i % 2 == 0 and part.strip():  # Actual sentence content
+            # Add filler words (rate increases with text length)
+            if random.random() > filler_threshold and len(part.split()) > 8:
+                words = part.split()
+                insert_pos = random.randint(1, min(2, len(words) - 1))
+                words.insert(insert_pos, random.choice(fillers) + ',')
+                part = ' '.join(words)
+
+            # Add casual intensifier (dynamic rate)
+            if random.random() > casual_threshold:
+                part = INTENSIFIABLE.sub(lambda m: f"{random.choice(casual)} {m.group(0)}", part, count=1)
+
+            # Start with And/But/So (dynamic rate)
+            if i > 0 and random.random() > starter_threshold:
+                part = part.strip()
+                if part and part[0].isupper():
+                    part = random.choice(starters) + part[0].lower() + part[1:]
+
+        result.append(part)
+
+    text = ''.join(result)
+
+    # 5.5. For long texts: Vary sentence length (split/merge)
+    if is_long_text:
+        sentences = SENTENCE_PARTS.split(text)
+        modified = []
+        i = 0
+        while i < len(sentences):
+            if i % 2 == 0 and sentences[i].strip():
+                sent = sentences[i].strip()
+                words = sent.split()
+
+                # Split very long sentences (>30 words)
+                if len(words) > 30 and random.random() > 0.7:
+                    # Find a good split point (conjunction)
+                    for j in range(10, len(words) - 10):
+                        if words[j].lower() in SPLIT_CONJUNCTIONS:
+                            first_part = ' '.join(words[:j])
+                            second_part = ' '.join(words[j+1:])
+                            modified.append(first_part + '.')
+                            if i + 1 < len(sentences):
+                                modified.append(sentences[i + 1])
+                            modified.append(' ' + second_part[0].upper() + second_part[1:] if len(second_part) > 1 else second_part.upper())
+                            i += 2
+                            break
+                    else:
+                        modified.append(sent)
+                        if i + 1 < len(sentences):
+                            modified.append(sentences[i + 1])
+                        i += 2
+                # Merge short sentences (<8 words)
+                elif len(words) < 8 and i + 2 < len(sentences) and random.random() > 0.6:
+                    next_sent = sentences[i + 2].strip() if i + 2 < len(sentences) else ''
+                    if next_sent:
+                        connector = random.choice([', and', ', but', ', so', ' -'])
+                        modified.append(sent + connector + ' ' + next_sent[0].lower() + next_sent[1:] if len(next_sent) > 1 else next_sent.lower())
+                        if i + 3 < len(sentences):
+                            modified.append(sentences[i + 3])
+                        i += 4
+                    else:
+                        modified.append(sent)
+                        if i + 1 < len(sentences):
+                            modified.append(sentences[i + 1])
+                        i += 2
+                else:
+                    modified.append(sent)
+                    if i + 1 < len(sentences):
+                        modified.append(sentences[i + 1])
+                    i += 2
+            else:
+                modified.append(sentences[i])
+                i += 1
+
+        text = ''.join(modified)
+
+    # 6. Add typos to safe common words (7% chance per word)
+    words = text.split()
+    for i in range(len(words)):
+        if random.random() > 0.93 and len(words[i]) > 2:
+            word = words[i]
+            letters_only = NON_ALPHA.sub('', word).lower()
+
+            if letters_only in SAFE_TYPO_WORDS:
+                typo_type = random.choice(['double', 'swap', 'missing'])
+
+                if typo_type == 'double' and len(letters_only) > 2:
+                    # Double a letter: "the" -> "thee"
+                    pos = random.randint(0, len(letters_only) - 1)
+                    letters_only = letters_only[:pos] + letters_only[pos] + letters_only[pos:]
+                elif typo_type == 'swap' and len(letters_only) > 2:
+                    # Swap letters: "the" -> "teh", "and" -> "adn"
+                    pos = random.randint(0, len(letters_only) - 2)
+                    letters_only = letters_only[:pos] + letters_only[pos+1] + letters_only[pos] + letters_only[pos+2:]
+                elif typo_type == 'missing' and len(letters_only) > 3:
+                    # Missing letter: "that" -> "tht"
+                    pos = random.randint(1, len(letters_only) - 2)
+                    letters_only = letters_only[:pos] + letters_only[pos+1:]
+
+                # Preserve capitalization
+                if len(word) > 0 and word[0].isupper() and len(letters_only) > 0:
+                    letters_only = letters_only[0].upper() + letters_only[1:]
+
+                words[i] = FIRST_LETTERS.sub(letters_only, word, count=1)
+
+    text = ' '.join(words)
+
+    # 7. Add spacing errors (15% chance)
+    if random.random() > 0.85:
+        # Missing space after period
+        text = PERIOD_BEFORE_CAPITAL.sub(lambda m: '.' + m.group(1) if random.random() > 0.5 else '. ' + m.group(1), text, count=random.randint(1, 2))
+
+    # Double spaces
+    if random.random() > 0.88:
+        sentences = text.split('. ')
+        if len(sentences) > 2:
+            idx = random.randint(0, len(sentences) - 1)
+            sentences[idx] = sentences[idx].replace(' ', '  ', 1)
+        text = '. '.join(sentences)
+
+    # 8. Missing commas (18% rate)
+    text = COMMA_SPACE.sub(lambda m: ' ' if random.random() > 0.82 else ', ', text)
+
+    # 9. Lowercase after period (rare typo) - the choice is drawn but left unused,
+    # kept so the random stream matches the reference engine
+    if random.random() > 0.95:
+        matches = PERIOD_BEFORE_LOWER.findall(text)
+        if matches:
+            random.choice(matches)
+
+    # 10. Break up uniform patterns and add variety
+    text = OVERALL_STARTER.sub(lambda m: random.choice(OVERALL_ALTERNATIVES), text)
+    text = THE_ARTICLE.sub(lambda m: random.choice(ARTICLE_ALTERNATIVES) if random.random() > 0.5 else m.group(0), text)
+
+    # Add more exclamation marks for emphasis (humans use these)
+    sentences = text.split('. ')
+    last = len(sentences) - 1
+    for i in range(len(sentences)):
+        if random.random() > 0.92 and len(sentences[i]) > 20:
+            if not sentences[i].endswith('!') and not sentences[i].endswith('?'):
+                sentences[i] = sentences[i] + '!' if i < last else sentences[i]
+    text = '. '.join(sentences)
+
+    # 11. For very long texts: Add paragraph breaks and transitions
+    if is_very_long:
+        sentences = text.split('. ')
+        if len(sentences) > 15:
+            # Add paragraph break every 5-8 sentences
+            for i in range(7, len(sentences), random.randint(5, 8)):
+                if random.random() > 0.5:
+                    sentences[i] = '\n\n' + random.choice(PARAGRAPH_TRANSITIONS) + ', ' + sentences[i][0].lower() + sentences[i][1:]
+                else:
+                    sentences[i] = '\n\n' + sentences[i]
+
+            text = '. '.join(sentences)
+
+    # 12. Add more human-like elements
+    # Occasional ellipsis (humans use these for pauses)
+    if random.random() > 0.92 and len(text) > 100:
+        text = PERIOD_SPACE.sub(lambda m: '... ' if random.random() > 0.7 else '. ', text, count=1)
+
+    # Em dashes for emphasis
+    if random.random() > 0.85:
+        text = SPACED_HYPHEN.sub(lambda m: ' — ' if random.random() > 0.5 else ' - ', text, count=random.randint(1, 2))
+
+    # 13. Clean up excessive errors but keep natural ones
+    text = EXCESS_WHITESPACE.sub('  ', text)  # Max 2 spaces
+    text = EXCESS_PERIODS.sub('...', text)   # Max 3 periods (ellipsis)
+    text = SPACE_BEFORE_PERIOD.sub('.', text)     # Fix space before period
+    text = EXCESS_NEWLINES.sub('\n\n', text)  # Max 2 line breaks
+    text = DOUBLE_PERIOD.sub('.', text)  # Fix double periods
+
+    return text.strip()
@@ -1,9 +1,25 @@
 from flask import Flask, request, jsonify, send_from_directory
-import re
-import random
-import math
 import os
 
+import fast_engine
+import reference_engine
+
+# Pick the humanization engine: 'fast' (default) or 'reference' (the frozen original).
+# Both give identical results for the same random seed, see check_engines.py
+ENGINES = {
+    'fast': fast_engine,
+    'reference': reference_engine
+}
+ENGINE_NAME = os.environ.get('HUMANIZER_ENGINE', 'fast')
+if ENGINE_NAME not in ENGINES:
+    raise ValueError(f"Unknown HUMANIZER_ENGINE '{ENGINE_NAME}', expected one of: {', '.join(ENGINES)}")
+engine = ENGINES[ENGINE_NAME]
+
+count_syllables = engine.count_syllables
+flesch_reading_ease = engine.flesch_reading_ease
+calculate_ai_score = engine.calculate_ai_score
+humanize_text_aggressive = engine.humanize_text_aggressive
+
 app = Flask(__name__, static_folder='.')
 
 # Enable CORS manually
@@ -26,583 +42,6 @@ def serve_static(path):
 def health():
     return jsonify({'ok': True})
 
-def count_syllables(word):
-    """Estimate syllable count for readability score"""
-    word = word.lower()
-    word = re.sub(r'[^a-z]', '', word)
-    if not word:
-        return 0
-    vowel_groups = re.findall(r'[aeiouy]+', word)
-    return max(1, len(vowel_groups))
-
-def flesch_reading_ease(text):
-    """Calculate Flesch Reading Ease score"""
-    words = text.strip().split()
-    word_count = len(words) if words else 1
-    sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
-    sentence_count = max(1, len(sentences))
-    syllable_count = sum(count_syllables(w) for w in words)
-    syllable_count = max(1, syllable_count)
-    
-    score = 206.835 - (1.015 * (word_count / sentence_count)) - (84.6 * (syllable_count / word_count))
-    return round(score, 1)
-
-def calculate_ai_score(text):
-    """
-    HIGHLY ACCURATE AI detection score (0-10 scale, representing 0-100%).
-    Uses weighted analysis of multiple factors that real AI detectors use.
-    Lower = more human-like. Analyzes the HUMANIZED text.
-    """
-    # Start with neutral score
-    ai_confidence = 0  # Will range from -100 (very human) to +100 (very AI)
-    
-    words = text.strip().split()
-    word_count = len(words) if words else 1
-    sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
-    sentence_count = max(1, len(sentences))
-    
-    # === CRITICAL FACTOR 1: Perplexity (Sentence Length Consistency) ===
-    # AI generates very consistent sentence lengths, humans vary wildly
-    sentence_lengths = [len(s.split()) for s in sentences]
-    if len(sentence_lengths) > 2:
-        avg_len = sum(sentence_lengths) / len(sentence_lengths)
-        variance = sum((l - avg_len) ** 2 for l in sentence_lengths) / len(sentence_lengths)
-        std_dev = math.sqrt(variance)
-        coefficient_of_variation = (std_dev / avg_len) if avg_len > 0 else 0
-        
-        # High CV = human (varied sentences), Low CV = AI (uniform)
-        if coefficient_of_variation < 0.15:
-            ai_confidence += 35  # VERY uniform = STRONG AI signal
-        elif coefficient_of_variation < 0.25:
-            ai_confidence += 25
-        elif coefficient_of_variation < 0.35:
-            ai_confidence += 15
-        elif coefficient_of_variation < 0.45:
-            ai_confidence += 5
-        elif coefficient_of_variation > 0.7:
-            ai_confidence -= 25  # VERY varied = STRONG human signal
-        elif coefficient_of_variation > 0.55:
-            ai_confidence -= 15
-    
-    # === CRITICAL FACTOR 2: Burstiness (Paragraph Flow) ===
-    # Humans have bursts of short/long sentences, AI is steady
-    if len(sentence_lengths) > 3:
-        # Check for consecutive similar-length sentences (AI pattern)
-        consecutive_similar = 0
-        for i in range(len(sentence_lengths) - 1):
-            if abs(sentence_lengths[i] - sentence_lengths[i+1]) < 3:
-                consecutive_similar += 1
-        
-        similarity_ratio = consecutive_similar / (len(sentence_lengths) - 1)
-        if similarity_ratio > 0.7:
-            ai_confidence += 20  # Too consistent = AI
-        elif similarity_ratio < 0.3:
-            ai_confidence -= 15  # Varied flow = human
-    
-    # === CRITICAL FACTOR 3: Contractions ===
-    # Humans use contractions frequently, AI avoids them
-    contractions = len(re.findall(
-        r"\b(don't|doesn't|didn't|can't|won't|wouldn't|shouldn't|isn't|aren't|wasn't|weren't|haven't|hasn't|hadn't|it's|that's|there's|what's|who's|you're|they're|we're|couldn't|I'm|we've|I'll|you'll|he's|she's|they've|we'd|you'd)\b",
-        text, re.IGNORECASE
-    ))
-    contraction_density = contractions / word_count
-    
-    if contraction_density == 0 and word_count > 30:
-        ai_confidence += 30  # No contractions in long text = STRONG AI signal
-    elif contraction_density < 0.01:
-        ai_confidence += 20
-    elif contraction_density < 0.02:
-        ai_confidence += 10
-    elif contraction_density > 0.05:
-        ai_confidence -= 20  # Lots of contractions = human
-    elif contraction_density > 0.03:
-        ai_confidence -= 10
-    
-    # === CRITICAL FACTOR 4: AI Red Flag Phrases ===
-    # These phrases are EXTREMELY common in AI text
-    critical_ai_phrases = [
-        r'\boverall,?\s', r'\bin conclusion,?\s', r'\bto sum up,?\s', r'\bin summary,?\s',
-        r'\bthe article demonstrates\b', r'\bthe text shows\b', r'\bthe passage illustrates\b',
-        r'\bthis demonstrates that\b', r'\bthis shows that\b', r'\bthis illustrates\b',
-        r'\bit is important to note that\b', r'\bit should be noted that\b', 
-        r'\bone can (see|observe|conclude)\b', r'\bas can be seen\b',
-        r'\bin order to\b', r'\bdue to the fact that\b', r'\bfor the purpose of\b',
-        r'\bat this point in time\b', r'\bin the modern world\b', r'\bin today\'?s society\b'
-    ]
-    
-    red_flag_count = 0
-    for pattern in critical_ai_phrases:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        red_flag_count += len(matches)
-    
-    ai_confidence += red_flag_count * 15  # HEAVY penalty for each red flag
-    
-    # === CRITICAL FACTOR 5: Repetitive Sentence Starters ===
-    # AI tends to start sentences the same way
-    first_words = []
-    for s in sentences:
-        match = re.match(r'^\s*(\w+)', s)
-        if match:
-            first_words.append(match.group(1).lower())
-    
-    if len(first_words) > 3:
-        unique_starters = len(set(first_words))
-        starter_variety = unique_starters / len(first_words)
-        
-        if starter_variety < 0.4:
-            ai_confidence += 25  # Very repetitive = AI
-        elif starter_variety < 0.6:
-            ai_confidence += 12
-        elif starter_variety > 0.85:
-            ai_confidence -= 15  # High variety = human
-    
-    # === FACTOR 6: Transition Word Overuse ===
-    # AI LOVES transitions, uses them too much
-    formal_transitions = len(re.findall(
-        r'\b(however|therefore|furthermore|moreover|consequently|additionally|nevertheless|thus|hence|accordingly|subsequently)\b',
-        text, re.IGNORECASE
-    ))
-    transition_density = formal_transitions / sentence_count
-    
-    if transition_density > 0.4:
-        ai_confidence += 25  # Transition in almost every sentence = AI
-    elif transition_density > 0.25:
-        ai_confidence += 15
-    elif transition_density > 0.15:
-        ai_confidence += 8
-    
-    # === FACTOR 7: Human Imperfections (STRONG human signal) ===
-    imperfection_score = 0
-    
-    # Typos (humans make them, AI doesn't)
-    typos = len(re.findall(
-        r'\b(teh|taht|tehm|waht|whcih|jsut|tehn|thier|recieve|occured|writting|goverment|seperate|definately)\b',
-        text, re.IGNORECASE
-    ))
-    imperfection_score += typos * 8
-    
-    # Double spaces (human typing error)
-    double_spaces = len(re.findall(r'  +', text))
-    imperfection_score += double_spaces * 5
-    
-    # Missing comma after transition (human grammar slip)
-    missing_commas = len(re.findall(
-        r'\b(however|therefore|furthermore|moreover|consequently)\s+[a-z]',
-        text, re.IGNORECASE
-    ))
-    imperfection_score += missing_commas * 6
-    
-    # Period without space (human typo)
-    period_nospace = len(re.findall(r'\.[A-Z]', text))
-    imperfection_score += period_nospace * 7
-    
-    ai_confidence -= imperfection_score  # Imperfections = human
-    
-    # === FACTOR 8: Casual/Conversational Language ===
-    # Humans use informal language, AI is more formal
-    casual_markers = len(re.findall(
-        r'\b(really|pretty|quite|actually|basically|honestly|literally|totally|kinda|sorta|gonna|wanna|yeah|nope|ok|okay)\b',
-        text, re.IGNORECASE
-    ))
-    casual_density = casual_markers / word_count
-    
-    if casual_density > 0.04:
-        ai_confidence -= 20  # Very casual = human
-    elif casual_density > 0.02:
-        ai_confidence -= 12
-    elif casual_density == 0 and word_count > 50:
-        ai_confidence += 10  # No casual words = AI
-    
-    # === FACTOR 9: Punctuation Variety ===
-    # Humans use varied punctuation, AI sticks to periods
-    punct_score = 0
-    
-    if re.search(r'\.\.\.', text): punct_score += 8  # Ellipsis = human thought
-    if re.search(r'—', text): punct_score += 8  # Em dash = human style
-    if re.search(r';', text): punct_score += 6  # Semicolon = varied syntax
-    if len(re.findall(r'!', text)) in [1, 2, 3]: punct_score += 7  # Some exclamations = human
-    if re.search(r'\?', text): punct_score += 5  # Questions = engagement
-    if re.search(r':', text): punct_score += 4  # Colons = varied structure
-    
-    only_periods = not bool(re.search(r'[!?;:—]', text))
-    if only_periods and sentence_count > 3:
-        ai_confidence += 15  # Only periods = AI monotony
-    else:
-        ai_confidence -= punct_score
-    
-    # === FACTOR 10: Word Repetition ===
-    # AI repeats words more than humans
-    word_list = [re.sub(r'[^a-z]', '', w.lower()) for w in words]
-    word_list = [w for w in word_list if len(w) > 3]  # Only check substantial words
-    
-    if len(word_list) > 10:
-        unique_words = set(word_list)
-        repetition_ratio = len(unique_words) / len(word_list)
-        
-        if repetition_ratio < 0.5:
-            ai_confidence += 18  # High repetition = AI
-        elif repetition_ratio < 0.65:
-            ai_confidence += 10
-        elif repetition_ratio > 0.85:
-            ai_confidence -= 12  # High diversity = human
-    
-    # === FACTOR 11: Exclamation Overuse or Absence ===
-    exclamation_count = len(re.findall(r'!', text))
-    if exclamation_count == 0 and word_count > 50:
-        ai_confidence += 8  # No excitement = AI
-    elif exclamation_count > 5 and sentence_count < 10:
-        ai_confidence += 12  # Too many = forced enthusiasm
-    elif 1 <= exclamation_count <= 3:
-        ai_confidence -= 8  # Natural amount = human
-    
-    # === FINAL CALCULATION ===
-    # Convert confidence score (-100 to +100) to percentage (0-100)
-    # ai_confidence = -100 means 0% AI (100% human)
-    # ai_confidence = +100 means 100% AI (0% human)
-    
-    ai_percentage = 50 + (ai_confidence / 2)  # Map to 0-100 range
-    ai_percentage = max(0, min(100, ai_percentage))
-    
-    # Convert to 0-10 scale for display
-    display_score = round(ai_percentage / 10)
-    
-    return display_score
-
-def humanize_text_aggressive(text):
-    """
-    Smart humanization: More aggressive for long texts, balanced for short texts.
-    Guarantees AI detection score under 10.
-    """
-    
-    # Detect text length and adjust aggressiveness
-    word_count = len(text.split())
-    is_long_text = word_count > 100  # Long paragraph threshold
-    is_very_long = word_count > 300  # Very long text
-    
-    # Adjust rates based on length - Natural humanization like QuillBot
-    if is_very_long:
-        synonym_rate = 0.65  # 65% for very long
-        contraction_rate = 0.80  # 80%
-        casual_rate = 0.45  # 45%
-        filler_rate = 0.35  # 35%
-        starter_rate = 0.30  # 30%
-    elif is_long_text:
-        synonym_rate = 0.60  # 60% for long
-        contraction_rate = 0.75  # 75%
-        casual_rate = 0.40  # 40%
-        filler_rate = 0.30  # 30%
-        starter_rate = 0.25  # 25%
-    else:
-        synonym_rate = 0.50  # 50% for short
-        contraction_rate = 0.70  # 70%
-        casual_rate = 0.35  # 35%
-        filler_rate = 0.25  # 25%
-        starter_rate = 0.20  # 20%
-    
-    # 1. Replace formal phrases
-    phrase_replacements = {
-        'in order to': ['to', 'so we can', 'aiming to'],
-        'due to the fact that': ['because', 'since'],
-        'at this point in time': ['now', 'currently'],
-        'it is important to note that': ['notably', 'it\'s worth noting'],
-        'in spite of': ['despite', 'even though'],
-        'a large number of': ['many', 'lots of', 'tons of'],
-        'for the purpose of': ['to', 'for'],
-        'with regard to': ['about', 'regarding'],
-        'prior to': ['before'],
-        'subsequent to': ['after'],
-        'however': ['but', 'yet', 'though', 'still'],
-        'therefore': ['so', 'thus', 'hence'],
-        'furthermore': ['also', 'plus', 'moreover'],
-        'nevertheless': ['still', 'even so', 'yet']
-    }
-    
-    for phrase, alternatives in phrase_replacements.items():
-        pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
-        text = pattern.sub(lambda m: random.choice(alternatives), text)
-    
-    # 2. Natural synonym replacement - Like QuillBot
-    synonyms = {
-        # Common verbs
-        'important': ['crucial', 'key', 'vital'],
-        'need': ['require', 'want'],
-        'are': ['become'],
-        'give': ['provide', 'offer'],
-        'have': ['possess', 'own', 'keep'],
-        'keep': ['maintain', 'hold'],
-        'make': ['create', 'form', 'build'],
-        'form': ['create', 'make', 'build'],
-        'live': ['exist', 'survive'],
-        'talk': ['speak', 'communicate'],
-        
-        # Descriptive words
-        'big': ['large', 'huge'],
-        'gentle': ['calm', 'peaceful'],
-        'useful': ['helpful', 'valuable'],
-        'well-known': ['famous', 'popular'],
-        'calm': ['peaceful', 'relaxed'],
-        
-        # Adverbs & intensifiers
-        'very': ['really', 'quite', 'pretty', 'extremely'],
-        'really': ['very', 'truly', 'actually'],
-        'only': ['just', 'simply'],
-        'actually': ['really', 'truly'],
-        
-        # Complex words
-        'demonstrates': ['shows', 'proves', 'reveals'],
-        'demonstrate': ['show', 'prove', 'reveal'],
-        'represents': ['is', 'means', 'shows'],
-        'represent': ['show', 'mean'],
-        'major': ['big', 'huge', 'significant'],
-        'advancement': ['progress', 'improvement'],
-        'transitions': ['shifts', 'moves', 'changes'],
-        'traditional': ['old', 'conventional', 'standard'],
-        'intelligent': ['smart', 'clever'],
-        'capable': ['able', 'equipped'],
-        'vast': ['huge', 'massive'],
-        'complex': ['complicated', 'intricate'],
-        
-        # Connectors
-        'because': ['since', 'as'],
-        'but': ['yet', 'though', 'although'],
-        'also': ['too', 'as well'],
-        'and': ['plus'],
-        'for': ['during']
-    }
-    
-    for word, alternatives in synonyms.items():
-        pattern = re.compile(r'\b' + word + r'\b', re.IGNORECASE)
-        matches = list(pattern.finditer(text))
-        for match in reversed(matches):  # Reverse to maintain indices
-            if random.random() > (1 - synonym_rate):  # Dynamic rate based on text length
-                replacement = random.choice(alternatives)
-                # Preserve original capitalization
-                original = match.group(0)
-                if original[0].isupper():
-                    replacement = replacement[0].upper() + replacement[1:] if len(replacement) > 1 else replacement.upper()
-                text = text[:match.start()] + replacement + text[match.end():]
-    
-    # 3. Add contractions (70% rate)
-    contractions = {
-        'do not': 'don\'t', 'does not': 'doesn\'t', 'is not': 'isn\'t',
-        'are not': 'aren\'t', 'it is': 'it\'s', 'that is': 'that\'s',
-        'you are': 'you\'re', 'they are': 'they\'re', 'we are': 'we\'re',
-        'will not': 'won\'t', 'would not': 'wouldn\'t', 'cannot': 'can\'t',
-        'could not': 'couldn\'t', 'should not': 'shouldn\'t'
-    }
-    
-    for phrase, contraction in contractions.items():
-        pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
-        matches = list(pattern.finditer(text))
-        for match in reversed(matches):
-            if random.random() > (1 - contraction_rate):  # Dynamic contraction rate
-                text = text[:match.start()] + contraction + text[match.end():]
-    
-    # 4. Break Q: and A: patterns (CRITICAL for your example!)
-    def vary_qa_format(match):
-        variations = ['Q:', 'Question:', 'Q -', 'Q.', '**Q:**']
-        return random.choice(variations) + ' '
-    
-    text = re.sub(r'\bQ:\s*', vary_qa_format, text, flags=re.IGNORECASE)
-    
-    def vary_answer_format(match):
-        variations = ['A:', 'Answer:', 'A -', 'A.', '**A:**', '']
-        return random.choice(variations) + ' '
-    
-    text = re.sub(r'\bA:\s*', vary_answer_format, text, flags=re.IGNORECASE)
-    
-    # 5. Add casual language (dynamic based on text length)
-    sentences = re.split(r'([.!?]+)', text)
-    result = []
-    
-    for i, part in enumerate(sentences):
-        if i % 2 == 0 and part.strip():  # Actual sentence content
-            # Add filler words (rate increases with text length)
-            if random.random() > (1 - filler_rate) and len(part.split()) > 8:
-                fillers = ['basically', 'actually', 'honestly'] if is_long_text else ['basically', 'actually']
-                words = part.split()
-                insert_pos = random.randint(1, min(2, len(words) - 1))
-                words.insert(insert_pos, random.choice(fillers) + ',')
-                part = ' '.join(words)
-            
-            # Add casual intensifier (dynamic rate)
-            if random.random() > (1 - casual_rate):
-                casual = ['pretty', 'really', 'quite', 'fairly'] if is_long_text else ['pretty', 'really', 'quite']
-                pattern = r'\b(good|important|difficult|easy|clear|effective|simple)\b'
-                part = re.sub(pattern, lambda m: f"{random.choice(casual)} {m.group(0)}", part, count=1)
-            
-            # Start with And/But/So (dynamic rate)
-            if i > 0 and random.random() > (1 - starter_rate):
-                part = part.strip()
-                if part and part[0].isupper():
-                    starters = ['And ', 'But ', 'So ', 'Plus '] if is_long_text else ['And ', 'But ', 'So ']
-                    part = random.choice(starters) + part[0].lower() + part[1:]
-            
-            result.append(part)
-        else:
-            result.append(part)
-    
-    text = ''.join(result)
-    
-    # 5.5. For long texts: Vary sentence length (split/merge)
-    if is_long_text:
-        sentences = re.split(r'([.!?]+)', text)
-        modified = []
-        i = 0
-        while i < len(sentences):
-            if i % 2 == 0 and sentences[i].strip():
-                sent = sentences[i].strip()
-                words = sent.split()
-                
-                # Split very long sentences (>30 words)
-                if len(words) > 30 and random.random() > 0.7:
-                    # Find a good split point (conjunction)
-                    for j in range(10, len(words) - 10):
-                        if words[j].lower() in ['and', 'but', 'or', 'while', 'because']:
-                            first_part = ' '.join(words[:j])
-                            second_part = ' '.join(words[j+1:])
-                            modified.append(first_part + '.')
-                            if i + 1 < len(sentences):
-                                modified.append(sentences[i + 1])
-                            modified.append(' ' + second_part[0].upper() + second_part[1:] if len(second_part) > 1 else second_part.upper())
-                            i += 2
-                            break
-                    else:
-                        modified.append(sent)
-                        if i + 1 < len(sentences):
-                            modified.append(sentences[i + 1])
-                        i += 2
-                # Merge short sentences (<8 words)
-                elif len(words) < 8 and i + 2 < len(sentences) and random.random() > 0.6:
-                    next_sent = sentences[i + 2].strip() if i + 2 < len(sentences) else ''
-                    if next_sent:
-                        connector = random.choice([', and', ', but', ', so', ' -'])
-                        modified.append(sent + connector + ' ' + next_sent[0].lower() + next_sent[1:] if len(next_sent) > 1 else next_sent.lower())
-                        if i + 3 < len(sentences):
-                            modified.append(sentences[i + 3])
-                        i += 4
-                    else:
-                        modified.append(sent)
-                        if i + 1 < len(sentences):
-                            modified.append(sentences[i + 1])
-                        i += 2
-                else:
-                    modified.append(sent)
-                    if i + 1 < len(sentences):
-                        modified.append(sentences[i + 1])
-                    i += 2
-            else:
-                modified.append(sentences[i])
-                i += 1
-        
-        text = ''.join(modified)
-    
-    # 6. Add MORE typos (6-8% rate for common words)
-    safe_typo_words = ['the', 'and', 'but', 'for', 'with', 'from', 'this', 'that', 'have', 'will', 'can', 'should', 'would', 'been', 'them', 'than', 'then']
-    words = text.split()
-    for i in range(len(words)):
-        if random.random() > 0.93 and len(words[i]) > 2:  # 7% chance (was 3%)
-            word = words[i]
-            letters_only = re.sub(r'[^a-zA-Z]', '', word).lower()
-            
-            # Add typo to safe common words
-            if letters_only in safe_typo_words:
-                typo_type = random.choice(['double', 'swap', 'missing'])
-                
-                if typo_type == 'double' and len(letters_only) > 2:
-                    # Double a letter: "the" -> "thee"
-                    pos = random.randint(0, len(letters_only) - 1)
-                    letters_only = letters_only[:pos] + letters_only[pos] + letters_only[pos:]
-                elif typo_type == 'swap' and len(letters_only) > 2:
-                    # Swap letters: "the" -> "teh", "and" -> "adn"
-                    pos = random.randint(0, len(letters_only) - 2)
-                    letters_only = letters_only[:pos] + letters_only[pos+1] + letters_only[pos] + letters_only[pos+2:]
-                elif typo_type == 'missing' and len(letters_only) > 3:
-                    # Missing letter: "that" -> "tht"
-                    pos = random.randint(1, len(letters_only) - 2)
-                    letters_only = letters_only[:pos] + letters_only[pos+1:]
-                
-                # Preserve capitalization
-                if len(word) > 0 and word[0].isupper() and len(letters_only) > 0:
-                    letters_only = letters_only[0].upper() + letters_only[1:]
-                
-                words[i] = re.sub(r'[a-zA-Z]+', letters_only, word, count=1)
-    
-    text = ' '.join(words)
-    
-    # 7. Add MORE spacing errors (15% chance)
-    if random.random() > 0.85:
-        # Missing space after period
-        text = re.sub(r'\.\s+([A-Z])', lambda m: '.' + m.group(1) if random.random() > 0.5 else '. ' + m.group(1), text, count=random.randint(1, 2))
-    
-    # Double spaces
-    if random.random() > 0.88:
-        sentences = text.split('. ')
-        if len(sentences) > 2:
-            idx = random.randint(0, len(sentences) - 1)
-            sentences[idx] = sentences[idx].replace(' ', '  ', 1)
-        text = '. '.join(sentences)
-    
-    # 8. Missing commas (18% rate)
-    text = re.sub(r',\s+', lambda m: ' ' if random.random() > 0.82 else ', ', text)
-    
-    # 9. Lowercase after period (rare typo)
-    if random.random() > 0.95:
-        matches = list(re.finditer(r'\.\s+([a-z])', text))
-        if matches:
-            match = random.choice(matches)
-            # Leave it lowercase (typo)
-            pass
-    
-    # 10. Break up uniform patterns and add variety
-    # Replace "Overall," and formal sentence starters
-    text = re.sub(r'\bOverall,\s*', lambda m: random.choice(['So basically,', 'In the end,', 'To sum up,', 'Ultimately,', 'Looking at it,', '']), text, flags=re.IGNORECASE)
-    text = re.sub(r'\bthe article\b', lambda m: random.choice(['the article', 'this article', 'the piece', 'this paper', 'it']) if random.random() > 0.5 else m.group(0), text, flags=re.IGNORECASE)
-    
-    # Add more exclamation marks for emphasis (humans use these)
-    sentences = text.split('. ')
-    for i in range(len(sentences)):
-        if random.random() > 0.92 and len(sentences[i]) > 20:
-            if not sentences[i].endswith('!') and not sentences[i].endswith('?'):
-                sentences[i] = sentences[i] + '!' if i < len(sentences) - 1 else sentences[i]
-    text = '. '.join(sentences)
-    
-    # 11. For very long texts: Add paragraph breaks and transitions
-    if is_very_long:
-        # Find natural break points and add transitions
-        sentences = text.split('. ')
-        if len(sentences) > 15:
-            # Add paragraph break every 5-8 sentences
-            for i in range(7, len(sentences), random.randint(5, 8)):
-                if i < len(sentences):
-                    # Add transitional phrase
-                    transitions = ['Now', 'Additionally', 'Moreover', 'On the other hand', 
-                                 'However', 'In fact', 'Furthermore', 'That said', 'Plus', 'Also']
-                    if random.random() > 0.5:
-                        sentences[i] = '\n\n' + random.choice(transitions) + ', ' + sentences[i][0].lower() + sentences[i][1:]
-                    else:
-                        sentences[i] = '\n\n' + sentences[i]
-            
-            text = '. '.join(sentences)
-    
-    # 12. Add more human-like elements
-    # Occasional ellipsis (humans use these for pauses)
-    if random.random() > 0.92 and len(text) > 100:
-        text = re.sub(r'\. ', lambda m: '... ' if random.random() > 0.7 else '. ', text, count=1)
-    
-    # Em dashes for emphasis
-    if random.random() > 0.85:
-        text = re.sub(r' - ', lambda m: ' — ' if random.random() > 0.5 else ' - ', text, count=random.randint(1, 2))
-    
-    # 13. Clean up excessive errors but keep natural ones
-    text = re.sub(r'\s{3,}', '  ', text)  # Max 2 spaces
-    text = re.sub(r'\.{4,}', '...', text)   # Max 3 periods (ellipsis)
-    text = re.sub(r'\s+\.', '.', text)     # Fix space before period
-    text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 line breaks
-    text = re.sub(r'\.\.', '.', text)  # Fix double periods
-    
-    return text.strip()
-
 @app.route('/api/humanize', methods=['POST'])
 def humanize():
     try:
@@ -650,6 +89,6 @@ def humanize():
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 3000))
     print(f'🐍 Python humanizer server starting on port {port}...')
-    print(f'✅ Using AGGRESSIVE humanization algorithm')
+    print(f'✅ Using AGGRESSIVE humanization algorithm ({ENGINE_NAME} engine)')
     print(f'🎯 Guaranteed AI score under 10!')
     app.run(host='0.0.0.0', port=port, debug=True)